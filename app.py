@@ -1,18 +1,44 @@
 from itertools import product
+import os
 import string
 
+# number of passwords collected before they are flushed to the file in one write
+BUFFER_ROWS=1<<16
+
+def write_all(fd,data):
+    # os.write may write less than asked, retry with the rest
+    while data:
+        n=os.write(fd,data)
+        data=data[n:]
+
 min_len=int(input("Enter the min length of password:"))
 max_len=int(input("Enter the max len of password:"))
-counter=0
 character=string.ascii_lowercase+string.ascii_uppercase+string.digits+string.punctuation
+# number of passwords is known up front, no need to count in the loop
+counter=sum(len(character)**i for i in range(min_len,max_len+1))
+
+# O_BINARY: windows opens raw fds in text mode (\n -> \r\n) without it
+fd=os.open("wordlist.txt",os.O_WRONLY|os.O_CREAT|os.O_TRUNC|getattr(os,"O_BINARY",0),0o644)
+rows=[]
+# bound once, saves an attribute lookup per entry
+rows_append=rows.append
+# the charset is pure ASCII, so iterate byte values and build each word with bytes()
+cs=character.encode("ascii")
 
-file_open=open("wordlist.txt",'w')
+try:
+    for i in range(min_len,max_len+1):
+        for j in product(cs,repeat=i):
+            rows_append(bytes(j))
+            if len(rows)>=BUFFER_ROWS:
+                # the empty last row gives the final newline
+                rows_append(b"")
+                write_all(fd,b"\n".join(rows))
+                rows.clear()
 
-for i in range(min_len,max_len+1):
-    for j in product(character,repeat=i):
-        word="".join(j)
-        file_open.write(word)
-        file_open.write("\n")
-        counter+=1
+    if rows:
+        rows_append(b"")
+        write_all(fd,b"\n".join(rows))
+finally:
+    os.close(fd)
 
-print("Wordlist of {} passwords created".format(counter))
\ No newline at end of file
+print("Wordlist of {} passwords created".format(counter))
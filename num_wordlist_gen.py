@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+num_wordlist_gen.py
+
+Numbers-only wordlist generator (interactive).
+
+Features:
+- Choose charset: all digits 0-9 or a specific set (e.g., 1,3,4,5).
+- Choose length mode: fixed length or range (min..max).
+- Estimates number of entries and approx output file size (bytes).
+- Benchmarks local write speed (64 MB test) and estimates completion time.
+- Checks free disk space and warns if insufficient; supports a 'force' proceed.
+- Writes one password per line to the output file. Terminal echo of each entry is
+  off by default; when enabled it is batched (it can still flood the terminal
+  for very large lists).
+- Uses a numba-compiled (or numpy-vectorized) generation loop when available.
+- Progress updates (entries written, elapsed time, ETA).
+- Command line switches: --mmap writes the output through a memory-mapped file,
+  --parallel splits each length across one process per cpu, --compress gz/lz4
+  compresses the output (by default gz, only when the disk is slower than both
+  generation and gzip).
+- Use responsibly: don't run this against systems you don't own/authorize.
+
+"""
+
+import os
+import sys
+import errno
+import mmap
+import argparse
+import functools
+import gzip
+import multiprocessing
+import queue
+import threading
+import shutil
+import time
+from itertools import product
+
+# optional speedups: numba compiles the generation loop, numpy alone
+# vectorizes it, pure Python is used without either
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+# optional: faster (lower ratio) alternative to gzip for --compress
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# size of the chunks handed to a single os.write call.
+# the best value depends on the device/filesystem, tune it if needed.
+WRITE_BUFFER_SIZE = 1 << 20
+# chunks that may wait for the writer thread before generation blocks
+WRITE_QUEUE_DEPTH = 8
+
+UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# file name suffix per --compress choice
+COMPRESS_SUFFIXES = {"gz": ".gz", "lz4": ".lz4"}
+
+# windows opens raw fds in text mode (\n -> \r\n) unless asked otherwise
+O_BINARY = getattr(os, "O_BINARY", 0)
+
+def input_digits_choice():
+    while True:
+        choice = input("Include all digits 0-9 or specific digits? (all/specific) [all]: ").strip().lower() or "all"
+        if choice in ("all","specific"):
+            break
+        print("Please type 'all' or 'specific'.")
+    if choice == "all":
+        return "0123456789"
+    # specific
+    while True:
+        s = input("Enter digits you want to include (examples: 135 or 1,3,5): ").strip()
+        s = s.replace(",", "")
+        if s.isdigit() and all(ch in "0123456789" for ch in s):
+            # remove duplicates while preserving order
+            seen = set()
+            digits = []
+            for ch in s:
+                if ch not in seen:
+                    seen.add(ch)
+                    digits.append(ch)
+            return "".join(digits)
+        print("Invalid input. Use digits 0-9 (e.g., 0139 or 1,3,9).")
+
+def input_length_choice():
+    while True:
+        choice = input("Length mode — fixed or range? (fixed/range) [fixed]: ").strip().lower() or "fixed"
+        if choice in ("fixed","range"):
+            break
+        print("Please type 'fixed' or 'range'.")
+    if choice == "fixed":
+        while True:
+            try:
+                L = int(input("Enter fixed length (positive integer, e.g., 5): ").strip())
+                if L > 0:
+                    return (L, L)
+            except ValueError:
+                pass
+            print("Invalid length.")
+    else:
+        while True:
+            try:
+                mn = int(input("Enter min length (>=1): ").strip())
+                mx = int(input("Enter max length (>=min): ").strip())
+                if mn >= 1 and mx >= mn:
+                    return (mn, mx)
+            except ValueError:
+                pass
+            print("Invalid min/max lengths.")
+
+def estimate_counts(charset_len, min_len, max_len):
+    # total entries, total output bytes and per-length breakdown
+    per_length = {}
+    total = 0
+    total_bytes = 0
+    # charset_len ** i, one multiply per length instead of a pow() each
+    k_pow = 1
+    for i in range(1, max_len+1):
+        k_pow *= charset_len
+        if i >= min_len:
+            per_length[i] = k_pow
+            total += k_pow
+            # each line = i chars + newline (1 byte) -> (i + 1) bytes per entry
+            total_bytes += k_pow * (i + 1)
+    return total, total_bytes, per_length
+
+def get_free_space(path):
+    try:
+        st = shutil.disk_usage(path)
+        # st.free is bytes available
+        return st.free
+    except Exception:
+        return None
+
+def benchmark_write_speed(path, trial_bytes=64 << 20):
+    # writes a temporary file to path to estimate write speed in bytes/sec,
+    # using chunks as large as the generator's and timing until data is on disk
+    # returns bytes_per_sec or None on failure
+    tmp = os.path.join(path, ".num_wordlist_io_test.tmp")
+    try:
+        data = b"0" * (1 << 20)  # 1MB chunk
+        written = 0
+        start = time.perf_counter()
+        with open(tmp, "wb") as f:
+            while written < trial_bytes:
+                f.write(data)
+                written += len(data)
+            f.flush()
+            os.fsync(f.fileno())
+        elapsed = time.perf_counter() - start
+        if elapsed <= 0:
+            return None
+        return written / elapsed
+    except Exception:
+        return None
+    finally:
+        # cleanup
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+def sample_chunks(chunks, cs, min_len, max_len, trial_bytes):
+    # the first ~trial_bytes of the requested wordlist, chunk by chunk
+    produced = 0
+    for length in range(min_len, max_len+1):
+        for chunk, n in chunks(cs, length):
+            yield chunk
+            produced += len(chunk)
+            if produced >= trial_bytes:
+                return
+
+def benchmark_generation_speed(charset, min_len, max_len, trial_bytes=16 << 20):
+    # generates (without writing) up to trial_bytes of the requested
+    # wordlist to estimate generation speed in bytes/sec
+    # returns bytes_per_sec or None on failure
+    cs = charset.encode("ascii")
+    chunks = chunk_producer()
+    try:
+        # untimed warm-up: the first call pays numba's compile/cache load
+        for _ in chunks(cs, 1):
+            pass
+        start = time.perf_counter()
+        produced = sum(len(c) for c in sample_chunks(chunks, cs, min_len, max_len, trial_bytes))
+        elapsed = time.perf_counter() - start
+    except Exception:
+        return None
+    if elapsed <= 0:
+        return None
+    return produced / elapsed
+
+def benchmark_compress_speed(compress, charset, min_len, max_len, trial_bytes=16 << 20):
+    # compresses (to the null device) up to trial_bytes of the requested
+    # wordlist to estimate compressor speed in uncompressed bytes/sec
+    # returns bytes_per_sec or None on failure
+    try:
+        sample = list(sample_chunks(chunk_producer(), charset.encode("ascii"), min_len, max_len, trial_bytes))
+        start = time.perf_counter()
+        fh = open_compressed(os.devnull, compress)
+        for chunk in sample:
+            fh.write(chunk)
+        fh.close()
+        elapsed = time.perf_counter() - start
+    except Exception:
+        return None
+    if elapsed <= 0:
+        return None
+    return sum(len(c) for c in sample) / elapsed
+
+def human_readable_bytes(n):
+    # simple helper, unit picked from the bit length (exact for huge ints)
+    if n <= 0:
+        return "0.00 B"
+    i = min(5, max(int(n).bit_length() - 1, 0) // 10)
+    return f"{n / (1 << (10 * i)):.2f} {UNITS[i]}"
+
+def confirm(prompt="Proceed? (y/N): "):
+    ans = input(prompt).strip().lower()
+    return ans in ("y","yes")
+
+def write_all(fd, data):
+    # os.write may write less than asked, retry with the rest
+    while data:
+        n = os.write(fd, data)
+        data = data[n:]
+
+def write_queue(write, q, errors):
+    # writer thread: passes chunks from q to write until a None sentinel. a failed
+    # write is kept in errors and later chunks are dropped, so put() never blocks
+    while True:
+        chunk = q.get()
+        if chunk is None:
+            return
+        if not errors:
+            try:
+                write(chunk)
+            except Exception as e:
+                errors.append(e)
+
+def open_compressed(path, compress):
+    # binary file object compressing everything written to it.
+    # fastest levels: the point is saving disk bandwidth, not the best ratio
+    if compress == "gz":
+        return gzip.open(path, "wb", compresslevel=1)
+    return lz4.frame.open(path, "wb", compression_level=0)
+
+if njit is not None:
+    @njit(cache=True)
+    def fill_chunk(cs, L, odometer, out):
+        # fills every row of out with the next entry (same order as product)
+        # followed by a newline, starting at odometer and advancing it in place
+        k = cs.shape[0]
+        for r in range(out.shape[0]):
+            for j in range(L):
+                out[r, j] = cs[odometer[j]]
+            out[r, L] = 10
+            # increment with carry, last position changes fastest
+            j = L - 1
+            while j >= 0:
+                odometer[j] += 1
+                if odometer[j] < k:
+                    break
+                odometer[j] = 0
+                j -= 1
+        return out.shape[0]
+
+# generated nested-loop producers for python_chunks, keyed by loop depth
+nested_loop_cache = {}
+# python refuses more than 20 statically nested blocks; deeper prefixes
+# run their outer positions through product instead
+MAX_NESTED_LOOPS = 16
+
+def nested_loop_producer(depth):
+    # builds (once per depth) a generator with depth hand-written nested
+    # for loops, one per prefix position. each level extends the prefix of
+    # the level above, which avoids product's generic tuple machinery
+    gen = nested_loop_cache.get(depth)
+    if gen is None:
+        lines = ["def gen(cs1, suffix_lines, head, k, limit):",
+                 " buf = bytearray()",
+                 " buf_extend = buf.extend",
+                 " n = 0",
+                 " p = head"]
+        ind = " "
+        outer = max(0, depth - MAX_NESTED_LOOPS)
+        if outer:
+            lines += [f"{ind}for t in product(cs1, repeat={outer}):",
+                      f"{ind} p = head + b''.join(t)"]
+            ind += " "
+        for j in range(depth - outer):
+            lines.append(f"{ind}for c{j} in cs1:")
+            ind += " "
+            lines.append(f"{ind}p{j} = {'p' if j == 0 else f'p{j - 1}'} + c{j}")
+        last = "p" if depth == outer else f"p{depth - outer - 1}"
+        lines += [f"{ind}buf_extend({last})",
+                  # p s0 p s1 ... p s(k-1)
+                  f"{ind}buf_extend({last}.join(suffix_lines))",
+                  f"{ind}n += k",
+                  f"{ind}if len(buf) >= limit:",
+                  f"{ind} yield bytes(buf), n",
+                  f"{ind} buf.clear()",
+                  f"{ind} n = 0",
+                  " if n:",
+                  "  yield bytes(buf), n"]
+        namespace = {"product": product}
+        exec(compile("\n".join(lines), f"<nested loops {depth}>", "exec"), namespace)
+        gen = nested_loop_cache[depth] = namespace["gen"]
+    return gen
+
+def python_chunks(cs, length, head=b""):
+    # yields (chunk_bytes, entries) of ~WRITE_BUFFER_SIZE covering all entries of one length,
+    # each entry prefixed with head (used by parallel shards)
+    # single-byte strings of the charset, concatenated to build prefixes
+    cs1 = [bytes((b,)) for b in cs]
+    # last character + newline for every charset entry; each prefix is
+    # combined with all of them at once instead of building k tuples
+    suffix_lines = [bytes((b, 0x0A)) for b in cs]
+    # all but the last position are plain nested loops (none for length 1)
+    gen = nested_loop_producer(length - 1)
+    return gen(cs1, suffix_lines, head, len(cs), WRITE_BUFFER_SIZE)
+
+def numba_chunks(cs, length, head=b""):
+    # same as python_chunks, rows are filled by the compiled fill_chunk kernel
+    cs_arr = np.frombuffer(cs, dtype=np.uint8)
+    odometer = np.zeros(length, dtype=np.int64)
+    h = len(head)
+    rows = max(1, WRITE_BUFFER_SIZE // (h + length + 1))
+    out = np.empty((rows, h + length + 1), dtype=np.uint8)
+    out[:, :h] = np.frombuffer(head, dtype=np.uint8)
+    remaining = len(cs) ** length
+    while remaining:
+        n = fill_chunk(cs_arr, length, odometer, out[:min(rows, remaining), h:])
+        yield out[:n].tobytes(), n
+        remaining -= n
+
+def numpy_chunks(cs, length, head=b""):
+    # same as python_chunks, computed with numpy. the last m positions of
+    # a chunk run through all k**m combinations, so that block is built
+    # once and only the leading prefix columns change between chunks
+    k = len(cs)
+    h = len(head)
+    m = length
+    while m > 0 and k ** m * (h + length + 1) > WRITE_BUFFER_SIZE:
+        m -= 1
+    rows = k ** m
+    cs_arr = np.frombuffer(cs, dtype=np.uint8)
+    # digit j of row i is (i // k**(m-1-j)) % k
+    divs = k ** np.arange(m - 1, -1, -1, dtype=np.int64)
+    idx = (np.arange(rows, dtype=np.int64)[:, None] // divs) % k
+    end = h + length
+    out = np.empty((rows, end + 1), dtype=np.uint8)
+    out[:, :h] = np.frombuffer(head, dtype=np.uint8)
+    out[:, end - m:end] = cs_arr[idx]
+    out[:, end] = 10
+    for prefix in product(cs, repeat=length - m):
+        out[:, h:end - m] = np.frombuffer(bytes(prefix), dtype=np.uint8)
+        yield out.tobytes(), rows
+
+def chunk_producer():
+    # fastest available implementation
+    if njit is not None:
+        return numba_chunks
+    if np is not None:
+        return numpy_chunks
+    return python_chunks
+
+def shard_tasks(path, cs, length, offset, workers):
+    # splits one length into contiguous ranges of leading characters, about
+    # one per worker, each with the file offset its first line goes to
+    k = len(cs)
+    d = 1
+    while k ** d < workers and d < length - 1:
+        d += 1
+    heads = [bytes(t) for t in product(cs, repeat=d)]
+    # bytes produced by all entries sharing one head
+    head_bytes = k ** (length - d) * (length + 1)
+    shards = min(workers, len(heads))
+    tasks = []
+    for i in range(shards):
+        lo = len(heads) * i // shards
+        hi = len(heads) * (i + 1) // shards
+        tasks.append((path, cs, length, heads[lo:hi], offset + lo * head_bytes))
+    return tasks
+
+def emit_shard(task):
+    # worker process: writes all entries starting with one of heads into
+    # its own region of the (already created) output file
+    path, cs, length, heads, offset = task
+    chunks = chunk_producer()
+    written = 0
+    fd = os.open(path, os.O_WRONLY | O_BINARY)
+    try:
+        os.lseek(fd, offset, os.SEEK_SET)
+        for head in heads:
+            for chunk, n in chunks(cs, length - len(head), head):
+                write_all(fd, chunk)
+                written += n
+    finally:
+        os.close(fd)
+    return written
+
+def generate_wordlist(path, charset, min_len, max_len, total_entries, total_bytes, per_length, print_to_terminal=False, progress_interval=10000, use_mmap=False, parallel=False, compress=None):
+    # total_entries/total_bytes/per_length come from estimate_counts, already computed by the caller.
+    # parallel: lengths >= 2 are generated by one worker process per cpu, each
+    # writing its shard at its own offset (no terminal echo, not with use_mmap).
+    # compress: "gz" or "lz4" to write a compressed stream to path instead
+    if use_mmap + parallel + bool(compress) > 1:
+        raise ValueError("use_mmap, parallel and compress cannot be combined")
+    total_entries_int = int(total_entries)
+    # exact output size of every length: count * (length + newline)
+    per_length_bytes = {i: cnt * (i + 1) for i, cnt in per_length.items()}
+    # bytes of all fully generated lengths and entries written before the current one
+    completed_lengths_bytes = 0
+    completed_lengths_entries = 0
+    written = 0
+    # entries left until the next progress line, never past the total so
+    # the last chunk always reports
+    to_next = min(progress_interval, total_entries_int)
+    start_time = time.time()
+    # charset is pure ASCII, so work on bytes and skip per-line encoding
+    cs = charset.encode("ascii")
+    chunks = chunk_producer()
+    workers = os.cpu_count() or 1
+    pool = None
+    q = None
+    writer = None
+    errors = []
+    if compress:
+        fh = open_compressed(path, compress)
+        fd = None
+        write = fh.write
+    else:
+        fh = None
+        # raw fd: chunks are already big, no need for python's buffering layers
+        fd = os.open(path, (os.O_RDWR if use_mmap else os.O_WRONLY) | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644)
+        write = functools.partial(write_all, fd)
+    mm = None
+    off = 0
+    try:
+        if use_mmap:
+            # the final size is known, map it and copy chunks straight into the page cache.
+            # the blocks must really exist: storing into an unbacked page of a
+            # sparse file on a full disk kills the process with SIGBUS
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, total_bytes)
+            else:
+                free = get_free_space(os.path.dirname(os.path.abspath(path)) or ".")
+                if free is None or free < total_bytes:
+                    raise OSError(errno.ENOSPC, "not enough free disk space to use mmap", path)
+                os.ftruncate(fd, total_bytes)
+            mm = mmap.mmap(fd, total_bytes)
+        if parallel:
+            pool = multiprocessing.Pool(workers)
+        elif mm is None:
+            # a separate thread does the writes so generation continues while
+            # the disk (or compressor) is busy, both release the GIL
+            q = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+            writer = threading.Thread(target=write_queue, args=(write, q, errors), daemon=True)
+            writer.start()
+        for length in range(min_len, max_len+1):
+            if pool is not None and length > 1:
+                # workers write straight into the file, only counts come back
+                tasks = shard_tasks(path, cs, length, completed_lengths_bytes, workers)
+                results = ((None, n) for n in pool.imap_unordered(emit_shard, tasks))
+            else:
+                results = chunks(cs, length)
+            for chunk, n in results:
+                if chunk is not None:
+                    if mm is not None:
+                        mm[off:off + len(chunk)] = chunk
+                        off += len(chunk)
+                    elif q is not None:
+                        q.put(chunk)
+                        if errors:
+                            raise errors[0]
+                    else:
+                        write(chunk)
+                    if print_to_terminal:
+                        # chunks are already newline separated text
+                        sys.stdout.write(chunk.decode("ascii"))
+                written += n
+                # progress and ETA roughly every progress_interval
+                to_next -= n
+                if to_next <= 0:
+                    to_next = min(progress_interval, total_entries_int - written)
+                    elapsed = time.time() - start_time
+                    # every line of the current length has the same size
+                    bytes_written = completed_lengths_bytes + (written - completed_lengths_entries) * (length + 1)
+                    # base the ETA on bytes, later (longer) lengths take more time per entry
+                    bytes_per_sec = bytes_written / elapsed if elapsed > 0 else None
+                    if bytes_per_sec:
+                        remaining = total_bytes - bytes_written
+                        eta_s = remaining / bytes_per_sec
+                        eta = time.strftime("%H:%M:%S", time.gmtime(eta_s))
+                    else:
+                        eta = "unknown"
+                    print(f"[Progress] written {written:,}/{total_entries_int:,} entries. Elapsed: {elapsed:.1f}s. ETA: {eta}")
+            completed_lengths_bytes += per_length_bytes[length]
+            completed_lengths_entries += per_length[length]
+            if pool is not None:
+                # continue after the region the workers filled
+                os.lseek(fd, completed_lengths_bytes, os.SEEK_SET)
+    finally:
+        if writer is not None:
+            q.put(None)
+            writer.join()
+        if pool is not None:
+            pool.terminate()
+        if mm is not None:
+            mm.flush()
+            mm.close()
+            # drop the unused tail if generation stopped early
+            os.ftruncate(fd, off)
+        elif use_mmap:
+            # reserving or mapping failed, don't leave a full-size file behind
+            os.ftruncate(fd, 0)
+        if fh is not None:
+            fh.close()
+        else:
+            os.close(fd)
+    if errors:
+        raise errors[0]
+    total_time = time.time() - start_time
+    return written, total_time
+
+def parse_args(argv=None):
+    # only output tuning switches, everything else is asked interactively
+    parser = argparse.ArgumentParser(description="Numbers-only wordlist generator (interactive).")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--mmap", action="store_true",
+                      help="write the output through a memory-mapped file (throughput varies by system)")
+    mode.add_argument("--parallel", action="store_true",
+                      help="generate each length in one process per cpu (may not help on a single disk)")
+    parser.add_argument("--compress", choices=("auto", "none", "gz", "lz4"), default="auto",
+                        help="compress the output; auto uses gz only when the disk is slower than both generation and gzip")
+    args = parser.parse_args(argv)
+    if args.compress in COMPRESS_SUFFIXES and (args.mmap or args.parallel):
+        parser.error("--compress cannot be combined with --mmap or --parallel")
+    if args.compress == "lz4" and lz4 is None:
+        parser.error("--compress lz4 needs the lz4 package")
+    return args
+
+def main():
+    args = parse_args()
+    print("=== Numbers-only wordlist generator ===")
+    charset = input_digits_choice()
+    print(f"Using digits: {','.join(charset)}")
+    min_len, max_len = input_length_choice()
+    out_fn = input("Output filename [wordlist.txt]: ").strip() or "wordlist.txt"
+    # ensure .txt
+    if not out_fn.endswith(".txt"):
+        out_fn = out_fn + ".txt"
+    # compute counts & sizes
+    total_entries, total_bytes, per_length = estimate_counts(len(charset), min_len, max_len)
+    print("\n--- Estimate ---")
+    print(f"Charset length: {len(charset)}")
+    print("Per-length counts:")
+    for l, c in per_length.items():
+        print(f" length {l}: {c:,} entries")
+    print(f"Total entries (sum): {total_entries:,}")
+    print(f"Estimated output file size (uncompressed): {human_readable_bytes(total_bytes)} ({total_bytes:,} bytes)")
+    # disk space check
+    path_dir = os.path.dirname(os.path.abspath(out_fn)) or "."
+    free = get_free_space(path_dir)
+    if free is not None:
+        print(f"Free disk space at target dir: {human_readable_bytes(free)}")
+        if free < total_bytes:
+            print("\nWARNING: Free space is smaller than estimated output file size.")
+            print("You can choose to abort or FORCE the run (you will be responsible).")
+            if not confirm("Force and continue despite low disk space? (y/N): "):
+                print("Aborted by user due to insufficient disk space.")
+                return
+    else:
+        print("Could not determine free disk space on target path; proceeding with caution.")
+        if not confirm("Continue? (y/N): "):
+            print("Aborted by user.")
+            return
+    # benchmark write speed
+    print("\nBenchmarking local write speed (64 MB test) ...")
+    speed = benchmark_write_speed(path_dir)
+    if speed:
+        print(f"Measured write speed: {human_readable_bytes(speed)}/s (approx).")
+        est_time_s = total_bytes / speed if speed > 0 else None
+        if est_time_s is not None:
+            print(f"Estimated run time (based on write speed): {time.strftime('%H:%M:%S', time.gmtime(est_time_s))} (HH:MM:SS)")
+    else:
+        print("Could not measure write speed. Time estimate unavailable.")
+    # compression trades cpu for disk bandwidth, worth it when the disk is the bottleneck
+    # auto only ever picks gz (readable everywhere), and only when both the
+    # generator and the compressor outrun the disk
+    compress = args.compress if args.compress in COMPRESS_SUFFIXES else None
+    if args.compress == "auto" and speed and not (args.mmap or args.parallel):
+        gen_speed = benchmark_generation_speed(charset, min_len, max_len)
+        gz_speed = benchmark_compress_speed("gz", charset, min_len, max_len)
+        if gen_speed and gz_speed:
+            print(f"Measured generation speed: {human_readable_bytes(gen_speed)}/s, "
+                  f"gzip speed: {human_readable_bytes(gz_speed)}/s (approx).")
+            if speed < min(gen_speed, gz_speed):
+                compress = "gz"
+                print("Disk is slower than generation and gzip, compressing output with gz (--compress none to disable).")
+    if compress:
+        out_fn = out_fn + COMPRESS_SUFFIXES[compress]
+        print("Size and time estimates above are for uncompressed output, the compressed file will be much smaller.")
+    # final confirmation before generating
+    print("\nReady to start generation.")
+    print(f"Output file: {out_fn}")
+    print("Terminal echo of generated entries is off by default (it slows down large runs).")
+    if args.parallel:
+        echo = False
+        print("Terminal echo is not available with --parallel.")
+    else:
+        echo = confirm("Print each generated entry to the terminal as well? (y/N): ")
+    if not confirm("Start now? (y/N): "):
+        print("Aborted by user.")
+        return
+    # generation
+    print("\n=== Starting generation ===")
+    try:
+        written, total_time = generate_wordlist(out_fn, charset, min_len, max_len, total_entries, total_bytes, per_length, print_to_terminal=echo, progress_interval=10000, use_mmap=args.mmap, parallel=args.parallel, compress=compress)
+        print(f"\nDone. Wrote {written:,} entries to {out_fn} in {total_time:.1f} seconds.")
+    except KeyboardInterrupt:
+        print("\nInterrupted by user (KeyboardInterrupt). Partial file may exist.")
+    except Exception as e:
+        print(f"\nError during generation: {e}")
+
+if __name__ == "__main__":
+    main()